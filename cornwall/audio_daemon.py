@@ -0,0 +1,90 @@
+"""Long-lived playback daemon for Cornwall.
+
+Forking `play` for every preview costs a process start and an audio device
+open each time. This daemon initializes PortAudio once and plays files on
+request over a UNIX socket at state/audio.sock, one JSON line per request:
+
+    {"cmd": "play", "path": "/abs/path/to/file.wav"}
+
+It replies {"ok": true} when playback finishes, or {"ok": false, "error": ...},
+and exits after IDLE_TIMEOUT seconds without a request.
+
+Run with `python3 -m cornwall.audio_daemon` from the repo root. Requires the
+optional sounddevice and soundfile packages; scripts fall back to spawning
+play/afplay when they aren't installed.
+"""
+
+import json
+import select
+import socket
+
+import sounddevice as sd
+import soundfile as sf
+
+from cornwall.state import STATE_DIR, _ensure_dirs
+
+SOCKET_PATH = STATE_DIR / "audio.sock"
+IDLE_TIMEOUT = 30.0
+
+
+def _play(conn: socket.socket, path: str):
+    """Play path, stopping early if the client hangs up (e.g. Ctrl-C)."""
+    data, rate = sf.read(path, dtype="float32", always_2d=True)
+    sd.play(data, rate)
+    # The client sends nothing more, so the socket turns readable only on
+    # EOF or reset: poll it while the sound plays
+    stream = sd.get_stream()
+    while stream.active:
+        if select.select([conn], [], [], 0.05)[0]:
+            sd.stop()
+            return
+    sd.wait()
+
+
+def _handle(conn: socket.socket):
+    with conn, conn.makefile("rb") as f:
+        try:
+            request = json.loads(f.readline())
+            if request.get("cmd") != "play":
+                raise ValueError(f"Unknown command: {request.get('cmd')}")
+            _play(conn, request["path"])
+            reply = {"ok": True}
+        except Exception as e:
+            reply = {"ok": False, "error": str(e)}
+        try:
+            conn.sendall((json.dumps(reply) + "\n").encode())
+        except OSError:
+            pass  # Client already gone
+
+
+def serve():
+    _ensure_dirs()
+    path = str(SOCKET_PATH)
+
+    # Another daemon may have won the race to start
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+            return
+        except OSError:
+            pass
+
+    SOCKET_PATH.unlink(missing_ok=True)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(path)
+        server.listen()
+        server.settimeout(IDLE_TIMEOUT)
+        try:
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except TimeoutError:
+                    break
+                conn.settimeout(None)
+                _handle(conn)
+        finally:
+            SOCKET_PATH.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    serve()
@@ -3,98 +3,107 @@
 Shared between play.py and fx.py so the logic isn't duplicated.
 """
 
+from collections import namedtuple
+
 from cornwall import state
 
+# One positional SoX argument. Optional params are only emitted when set;
+# the rest fall back to their default. prefix is glued onto the value.
+Param = namedtuple("Param", "key default optional prefix", defaults=(None, False, ""))
+
+# Cornwall effect name -> (SoX effect name, positional params in order)
+_SOX_SPEC: dict[str, tuple[str, tuple[Param, ...]]] = {
+    "reverb": ("reverb", (
+        Param("reverberance", optional=True),
+        Param("hf_damping", optional=True),
+        Param("room_scale", optional=True),
+    )),
+    "delay": ("echo", (
+        Param("gain_in", 0.8),
+        Param("gain_out", 0.9),
+        Param("delay_ms", 500),
+        Param("decay", 0.3),
+    )),
+    "chorus": ("chorus", (
+        Param("gain_in", 0.7),
+        Param("gain_out", 0.9),
+        Param("delay_ms", 55),
+        Param("decay", 0.4),
+        Param("speed", 0.25),
+        Param("shape", "s", prefix="-"),
+    )),
+    "flanger": ("flanger", ()),
+    "phaser": ("phaser", ()),
+    "tremolo": ("tremolo", (
+        Param("speed", 6),
+        Param("depth", optional=True),
+    )),
+    "overdrive": ("overdrive", (Param("gain", 20),)),
+    "compressor": ("compand", (
+        Param("attack_decay", "0.3,1"),
+        Param("transfer", "6:-70,-60,-20"),
+    )),
+    "eq": ("equalizer", (
+        Param("frequency", 1000),
+        Param("width", "1q"),
+        Param("gain", 0),
+    )),
+    "bass": ("bass", (Param("gain", 0),)),
+    "treble": ("treble", (Param("gain", 0),)),
+    "lowpass": ("lowpass", (Param("frequency", 3000),)),
+    "highpass": ("highpass", (Param("frequency", 300),)),
+    "pitch": ("pitch", (Param("cents", 0),)),
+    "tempo": ("tempo", (Param("factor", 1.0),)),
+    "norm": ("norm", (Param("level", optional=True),)),
+    "fade": ("fade", (
+        Param("type", "t"),
+        Param("fade_in", 0),
+        Param("stop", 0),
+        Param("fade_out", 0),
+    )),
+}
+
+# Complete argv per table effect when no params are set, e.g. "fx.py add 1 chorus"
+_DEFAULT_ARGS: dict[str, tuple[str, ...]] = {
+    name: (sox_name,) + tuple(p.prefix + str(p.default) for p in spec if not p.optional)
+    for name, (sox_name, spec) in _SOX_SPEC.items()
+}
+
 
-def build_sox_effects(track_id: int) -> list[str]:
-    """Build SoX command-line effect arguments from a track's effects chain."""
-    effects = state.get_track_effects(track_id)
-    args = []
+def _iter_sox_args(effects: list[dict]):
+    """Yield the SoX argv strings for an effects chain, in order."""
     for fx in effects:
         name = fx["name"]
-        params = fx.get("params", {})
+        params = fx.get("params")
+        if not params:
+            yield from _DEFAULT_ARGS.get(name, (name,))
+            continue
 
-        if name == "reverb":
-            args.append("reverb")
-            if "reverberance" in params:
-                args.append(str(params["reverberance"]))
-            if "hf_damping" in params:
-                args.append(str(params["hf_damping"]))
-            if "room_scale" in params:
-                args.append(str(params["room_scale"]))
-        elif name == "delay":
-            args.append("echo")
-            args.append(str(params.get("gain_in", 0.8)))
-            args.append(str(params.get("gain_out", 0.9)))
-            args.append(str(params.get("delay_ms", 500)))
-            args.append(str(params.get("decay", 0.3)))
-        elif name == "chorus":
-            args.append("chorus")
-            args.append(str(params.get("gain_in", 0.7)))
-            args.append(str(params.get("gain_out", 0.9)))
-            args.append(str(params.get("delay_ms", 55)))
-            args.append(str(params.get("decay", 0.4)))
-            args.append(str(params.get("speed", 0.25)))
-            args.append("-" + str(params.get("shape", "s")))
-        elif name == "flanger":
-            args.append("flanger")
-        elif name == "phaser":
-            args.append("phaser")
-        elif name == "tremolo":
-            args.append("tremolo")
-            args.append(str(params.get("speed", 6)))
-            if "depth" in params:
-                args.append(str(params["depth"]))
-        elif name == "overdrive":
-            args.append("overdrive")
-            args.append(str(params.get("gain", 20)))
-        elif name == "compressor":
-            args.append("compand")
-            args.append(str(params.get("attack_decay", "0.3,1")))
-            args.append(str(params.get("transfer", "6:-70,-60,-20")))
-        elif name == "eq":
-            args.append("equalizer")
-            args.append(str(params.get("frequency", 1000)))
-            args.append(str(params.get("width", "1q")))
-            args.append(str(params.get("gain", 0)))
-        elif name == "bass":
-            args.append("bass")
-            args.append(str(params.get("gain", 0)))
-        elif name == "treble":
-            args.append("treble")
-            args.append(str(params.get("gain", 0)))
-        elif name == "lowpass":
-            args.append("lowpass")
-            args.append(str(params.get("frequency", 3000)))
-        elif name == "highpass":
-            args.append("highpass")
-            args.append(str(params.get("frequency", 300)))
-        elif name == "pitch":
-            args.append("pitch")
-            args.append(str(params.get("cents", 0)))
-        elif name == "tempo":
-            args.append("tempo")
-            args.append(str(params.get("factor", 1.0)))
-        elif name == "norm":
-            args.append("norm")
-            if "level" in params:
-                args.append(str(params["level"]))
-        elif name == "fade":
-            args.append("fade")
-            args.append(str(params.get("type", "t")))
-            args.append(str(params.get("fade_in", 0)))
-            args.append(str(params.get("stop", 0)))
-            args.append(str(params.get("fade_out", 0)))
-        elif name == "lowpass":
-            args.append("lowpass")
-            args.append(str(params.get("frequency", 3000)))
-        elif name == "highpass":
-            args.append("highpass")
-            args.append(str(params.get("frequency", 300)))
-        else:
+        sox_name, spec = _SOX_SPEC.get(name, (name, None))
+        yield sox_name
+        if spec is None:
             # Pass through as raw sox effect
-            args.append(name)
-            for v in params.values():
-                args.append(str(v))
+            yield from map(str, params.values())
+            continue
+
+        for p in spec:
+            if p.key in params:
+                value = params[p.key]
+            elif p.optional:
+                continue
+            else:
+                value = p.default
+            yield p.prefix + str(value)
+
+
+def build_sox_effects(track_id: int, snapshot: state.Snapshot | None = None) -> list[str]:
+    """Build SoX command-line effect arguments from a track's effects chain.
 
-    return args
+    Pass a snapshot from state.load_snapshot() when building for several
+    tracks so the effects are read once rather than per track.
+    """
+    if snapshot is not None:
+        effects = snapshot.track_effects(track_id)
+    else:
+        effects = state.get_track_effects(track_id)
+    return list(_iter_sox_args(effects))
@@ -4,12 +4,38 @@ All project state lives in state/ as JSON files. This module provides
 read/write access with sensible defaults so scripts don't duplicate logic.
 """
 
+import copy
+import functools
 import json
 import os
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional, stdlib json is the fallback
+    orjson = None
+
+
+def _json_dumps(data: Any) -> bytes:
+    # Raw UTF-8 like orjson, so both writers produce the same bytes
+    return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode()
+
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(data: Any) -> bytes:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:  # orjson.JSONEncodeError, e.g. an int beyond 64 bits
+            return _json_dumps(data)
+else:
+    _loads = json.loads
+    _dumps = _json_dumps
+
 # Resolve paths relative to the repo root (one level up from cornwall/ package)
 ROOT = Path(__file__).resolve().parent.parent
 STATE_DIR = ROOT / "state"
@@ -17,44 +43,114 @@ PROJECTS_DIR = ROOT / "projects"
 
 PROJECT_FILE = STATE_DIR / "project.json"
 TRACKS_FILE = STATE_DIR / "tracks.json"
-EFFECTS_FILE = STATE_DIR / "effects.json"
+EFFECTS_DIR = STATE_DIR / "effects"  # One <track_id>.json chain per track
+LEGACY_EFFECTS_FILE = STATE_DIR / "effects.json"  # Old single-file layout, migrated on first use
 MIX_FILE = STATE_DIR / "mix.json"
 PID_FILE = STATE_DIR / ".playback.pid"
 
 
 def _ensure_dirs():
     STATE_DIR.mkdir(exist_ok=True)
+    EFFECTS_DIR.mkdir(exist_ok=True)
     PROJECTS_DIR.mkdir(exist_ok=True)
 
 
-def _read_json(path: Path, default: Any = None) -> Any:
-    if not path.exists():
+@functools.lru_cache(maxsize=1)
+def _state_entries() -> frozenset[str]:
+    """Names of files directly in STATE_DIR from one scandir, reused until state changes.
+
+    Only answers "does it exist"; freshness checks stat the file itself, since
+    other processes (the player, a second script) rewrite files in place.
+    """
+    try:
+        with os.scandir(STATE_DIR) as it:
+            return frozenset(e.name for e in it if e.is_file())
+    except FileNotFoundError:
+        return frozenset()
+
+
+def _state_changed():
+    """Call after creating or removing anything in STATE_DIR."""
+    _state_entries.cache_clear()
+
+
+def _stat(path: Path) -> os.stat_result | None:
+    try:
+        if path.parent == STATE_DIR and path.name not in _state_entries():
+            return None  # Skip the stat for files known to be missing
+        return path.stat()
+    except FileNotFoundError:
+        return None
+
+
+# Parsed JSON keyed by path: (st_mtime_ns, st_size, raw bytes, data). A single
+# script invocation calls several get_* helpers that hit the same files; this
+# lets them share one parse as long as the file is unchanged on disk, and lets
+# _write_json skip saves that wouldn't change the file.
+_cache: dict[Path, tuple[int, int, bytes, Any]] = {}
+
+
+def _load_json(path: Path, default: Any = None) -> Any:
+    """Return the shared cached parse of path. Callers must not mutate it."""
+    st = _stat(path)
+    if st is None:
+        _cache.pop(path, None)
         return default
-    with open(path) as f:
-        return json.load(f)
+    cached = _cache.get(path)
+    if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+        raw = path.read_bytes()
+        cached = (st.st_mtime_ns, st.st_size, raw, _loads(raw))
+        _cache[path] = cached
+    return cached[3]
+
+
+def _read_json(path: Path, default: Any = None) -> Any:
+    # Callers mutate what they get back and save it, so never hand out the cached object
+    return copy.deepcopy(_load_json(path, default))
 
 
 def _write_json(path: Path, data: Any):
+    raw = _dumps(data)
+    cached = _cache.get(path)
+    if cached is not None and cached[2] == raw:
+        st = _stat(path)
+        if st is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return  # Already on disk byte-for-byte
     _ensure_dirs()
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+    # Write beside the target and swap it in, so readers never see a partial file
+    tmp = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+    try:
+        tmp.write_bytes(raw)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    finally:
+        _state_changed()
+    st = path.stat()
+    _cache[path] = (st.st_mtime_ns, st.st_size, raw, _loads(raw))
 
 
 # --- Project ---
 
 def project_exists() -> bool:
-    return PROJECT_FILE.exists()
+    return PROJECT_FILE.name in _state_entries()
+
+
+_NO_PROJECT = "Error: No project loaded. Run 'scripts/project.py create' first."
 
 
 def require_project():
     if not project_exists():
-        raise SystemExit("Error: No project loaded. Run 'scripts/project.py create' first.")
+        raise SystemExit(_NO_PROJECT)
 
 
 def get_project() -> dict:
-    require_project()
-    return _read_json(PROJECT_FILE)
+    # One cache lookup doubles as the existence check
+    project = _load_json(PROJECT_FILE)
+    if project is None:
+        raise SystemExit(_NO_PROJECT)
+    return copy.deepcopy(project)
 
 
 def save_project(data: dict):
@@ -76,13 +172,17 @@ def create_project(name: str, bpm: int = 120, sample_rate: int = 44100, time_sig
     }
     save_project(project)
     _write_json(TRACKS_FILE, [])
-    _write_json(EFFECTS_FILE, {})
+    LEGACY_EFFECTS_FILE.unlink(missing_ok=True)
+    _state_changed()
+    for path in EFFECTS_DIR.glob("*.json"):
+        path.unlink()
     _write_json(MIX_FILE, {"master_volume": 1.0, "output_format": "wav", "output_file": "mix.wav"})
     return project
 
 
-def get_project_dir() -> Path:
-    project = get_project()
+def get_project_dir(project: dict | None = None) -> Path:
+    if project is None:
+        project = get_project()
     return PROJECTS_DIR / project.get("project_dir", project["name"])
 
 
@@ -96,18 +196,34 @@ def save_tracks(tracks: list[dict]):
     _write_json(TRACKS_FILE, tracks)
 
 
+# (parsed tracks list, track id -> list position, max id), rebuilt only when
+# the cached parse of tracks.json is replaced
+_track_index: tuple[list[dict] | None, dict[int, int], int] = (None, {}, 0)
+
+
+def _index_tracks() -> tuple[list[dict], dict[int, int], int]:
+    global _track_index
+    tracks = _load_json(TRACKS_FILE, [])
+    if _track_index[0] is not tracks:
+        positions = {t["id"]: i for i, t in enumerate(tracks)}
+        _track_index = (tracks, positions, max(positions, default=0))
+    return _track_index
+
+
+def count_tracks() -> int:
+    return len(_load_json(TRACKS_FILE, []))
+
+
 def next_track_id() -> int:
-    tracks = get_tracks()
-    if not tracks:
-        return 1
-    return max(t["id"] for t in tracks) + 1
+    return _index_tracks()[2] + 1
 
 
 def get_track(track_id: int) -> dict | None:
-    for t in get_tracks():
-        if t["id"] == track_id:
-            return t
-    return None
+    tracks, positions, _ = _index_tracks()
+    pos = positions.get(track_id)
+    if pos is None:
+        return None
+    return copy.deepcopy(tracks[pos])
 
 
 def require_track(track_id: int) -> dict:
@@ -134,95 +250,125 @@ def add_track(name: str, track_type: str = "audio") -> dict:
     save_tracks(tracks)
 
     # Initialize empty effects chain
-    effects = get_effects()
-    effects[str(track["id"])] = []
-    save_effects(effects)
+    save_track_effects(track["id"], [])
 
     return track
 
 
 def update_track(track_id: int, **fields) -> dict:
-    tracks = get_tracks()
-    for t in tracks:
-        if t["id"] == track_id:
-            t.update(fields)
-            save_tracks(tracks)
-            return t
-    raise SystemExit(f"Error: Track {track_id} not found")
+    cached, positions, _ = _index_tracks()
+    pos = positions.get(track_id)
+    if pos is None:
+        raise SystemExit(f"Error: Track {track_id} not found")
+    tracks = copy.deepcopy(cached)
+    t = tracks[pos]
+    t.update(fields)
+    save_tracks(tracks)
+    return t
 
 
 def remove_track(track_id: int) -> dict:
-    tracks = get_tracks()
-    removed = None
-    new_tracks = []
-    for t in tracks:
-        if t["id"] == track_id:
-            removed = t
-        else:
-            new_tracks.append(t)
-    if removed is None:
+    cached, positions, _ = _index_tracks()
+    pos = positions.get(track_id)
+    if pos is None:
         raise SystemExit(f"Error: Track {track_id} not found")
-    save_tracks(new_tracks)
+    tracks = copy.deepcopy(cached)
+    removed = tracks.pop(pos)
+    save_tracks(tracks)
 
     # Remove effects chain
-    effects = get_effects()
-    effects.pop(str(track_id), None)
-    save_effects(effects)
+    _effects_path(track_id).unlink(missing_ok=True)
 
     return removed
 
 
-def get_active_tracks() -> list[dict]:
+def get_active_tracks(tracks: list[dict] | None = None) -> list[dict]:
     """Get tracks that should be heard: if any solo, only solo'd; otherwise all unmuted."""
-    tracks = get_tracks()
-    solo_tracks = [t for t in tracks if t["solo"] and t["source"]]
-    if solo_tracks:
-        return solo_tracks
-    return [t for t in tracks if not t["mute"] and t["source"]]
+    if tracks is None:
+        tracks = get_tracks()
+    solo, unmuted = [], []
+    for t in tracks:
+        if not t["source"]:
+            continue
+        if t["solo"]:
+            solo.append(t)
+        if not t["mute"]:
+            unmuted.append(t)
+    return solo or unmuted
 
 
 # --- Effects ---
 
+_legacy_effects_checked = False
+
+
+def migrate_effects():
+    """Split a legacy state/effects.json into per-track files under state/effects/."""
+    legacy = _read_json(LEGACY_EFFECTS_FILE)
+    if legacy is None:
+        return
+    for track_id, chain in legacy.items():
+        _write_json(_effects_path(track_id), chain)
+    LEGACY_EFFECTS_FILE.unlink()
+    _state_changed()
+
+
+def _check_legacy_effects():
+    global _legacy_effects_checked
+    if not _legacy_effects_checked:
+        _legacy_effects_checked = True
+        migrate_effects()
+
+
+def _effects_path(track_id: int | str) -> Path:
+    _check_legacy_effects()
+    return EFFECTS_DIR / f"{track_id}.json"
+
+
 def get_effects() -> dict:
-    return _read_json(EFFECTS_FILE, {})
+    """All effects chains keyed by track id string."""
+    _check_legacy_effects()
+    return {path.stem: _read_json(path, []) for path in EFFECTS_DIR.glob("*.json")}
 
 
 def save_effects(effects: dict):
-    _write_json(EFFECTS_FILE, effects)
+    """Replace every effects chain. Prefer save_track_effects for a single track."""
+    for path in EFFECTS_DIR.glob("*.json"):
+        if path.stem not in effects:
+            path.unlink()
+    for track_id, chain in effects.items():
+        save_track_effects(track_id, chain)
 
 
 def get_track_effects(track_id: int) -> list[dict]:
-    effects = get_effects()
-    return effects.get(str(track_id), [])
+    return _read_json(_effects_path(track_id), [])
+
+
+def save_track_effects(track_id: int | str, chain: list[dict]):
+    _write_json(_effects_path(track_id), chain)
 
 
 def add_effect(track_id: int, name: str, params: dict | None = None) -> dict:
     require_track(track_id)
-    effects = get_effects()
-    chain = effects.get(str(track_id), [])
+    chain = get_track_effects(track_id)
     effect = {"name": name, "params": params or {}}
     chain.append(effect)
-    effects[str(track_id)] = chain
-    save_effects(effects)
+    save_track_effects(track_id, chain)
     return effect
 
 
 def remove_effect(track_id: int, index: int) -> dict:
-    effects = get_effects()
-    chain = effects.get(str(track_id), [])
+    chain = get_track_effects(track_id)
     if index < 0 or index >= len(chain):
         raise SystemExit(f"Error: Effect index {index} out of range (track has {len(chain)} effects)")
     removed = chain.pop(index)
-    effects[str(track_id)] = chain
-    save_effects(effects)
+    save_track_effects(track_id, chain)
     return removed
 
 
 def clear_effects(track_id: int):
     require_track(track_id)
-    effects = get_effects()
-    effects[str(track_id)] = []
-    save_effects(effects)
+    save_track_effects(track_id, [])
 
 
 # --- Mix ---
@@ -235,24 +381,64 @@ def save_mix(data: dict):
     _write_json(MIX_FILE, data)
 
 
+# --- Snapshot ---
+
+@dataclass
+class Snapshot:
+    """All project state read in one go, for commands that touch many tracks."""
+
+    tracks: list[dict]
+    effects: dict
+    mix: dict
+    project: dict
+    active_tracks: list[dict] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.active_tracks = get_active_tracks(self.tracks)
+
+    def track_effects(self, track_id: int) -> list[dict]:
+        return self.effects.get(str(track_id), [])
+
+
+def load_snapshot() -> Snapshot:
+    return Snapshot(tracks=get_tracks(), effects=get_effects(), mix=get_mix(), project=get_project())
+
+
 # --- Playback PID ---
 
+# Result of the first get_playback_pid() check, kept for the rest of the process
+_UNCHECKED = object()
+_playback_pid: Any = _UNCHECKED
+
+
 def get_playback_pid() -> int | None:
-    if not PID_FILE.exists():
+    global _playback_pid
+    if _playback_pid is not _UNCHECKED:
+        return _playback_pid
+    _playback_pid = None
+    if PID_FILE.name not in _state_entries():
         return None
     try:
         pid = int(PID_FILE.read_text().strip())
         os.kill(pid, 0)  # Check if process exists
+        _playback_pid = pid
         return pid
     except (ValueError, ProcessLookupError, PermissionError):
         PID_FILE.unlink(missing_ok=True)
+        _state_changed()
         return None
 
 
 def save_playback_pid(pid: int):
+    global _playback_pid
     _ensure_dirs()
     PID_FILE.write_text(str(pid))
+    _state_changed()
+    _playback_pid = pid
 
 
 def clear_playback_pid():
+    global _playback_pid
     PID_FILE.unlink(missing_ok=True)
+    _state_changed()
+    _playback_pid = None
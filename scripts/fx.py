@@ -62,130 +62,146 @@ Examples:
 """
 
 import argparse
+import functools
+import os
+import re
 import subprocess
 import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from cornwall import state
-
-EFFECTS_CATALOG = {
-    "reverb": {
-        "description": "Reverberation - simulates acoustic space",
-        "params": {
-            "reverberance": "Reverb amount 0-100 (default: 50)",
-            "hf_damping": "High frequency damping 0-100 (default: 50)",
-            "room_scale": "Room size 0-100 (default: 100)",
+from cornwall.sox_effects import build_sox_effects
+
+
+@functools.lru_cache(maxsize=1)
+def _catalog() -> dict[str, dict]:
+    """Effect catalog, built on first use so commands that don't need it skip it."""
+    return {
+        "reverb": {
+            "description": "Reverberation - simulates acoustic space",
+            "params": {
+                "reverberance": "Reverb amount 0-100 (default: 50)",
+                "hf_damping": "High frequency damping 0-100 (default: 50)",
+                "room_scale": "Room size 0-100 (default: 100)",
+            },
         },
-    },
-    "delay": {
-        "description": "Echo / delay effect",
-        "params": {
-            "gain_in": "Input gain 0-1 (default: 0.8)",
-            "gain_out": "Output gain 0-1 (default: 0.9)",
-            "delay_ms": "Delay time in milliseconds (default: 500)",
-            "decay": "Decay factor 0-1 (default: 0.3)",
+        "delay": {
+            "description": "Echo / delay effect",
+            "params": {
+                "gain_in": "Input gain 0-1 (default: 0.8)",
+                "gain_out": "Output gain 0-1 (default: 0.9)",
+                "delay_ms": "Delay time in milliseconds (default: 500)",
+                "decay": "Decay factor 0-1 (default: 0.3)",
+            },
         },
-    },
-    "chorus": {
-        "description": "Chorus effect - thickens sound",
-        "params": {
-            "gain_in": "Input gain (default: 0.7)",
-            "gain_out": "Output gain (default: 0.9)",
-            "delay_ms": "Modulation delay in ms (default: 55)",
-            "decay": "Decay (default: 0.4)",
-            "speed": "Modulation speed in Hz (default: 0.25)",
-            "shape": "Modulation shape: s=sine, t=triangle (default: s)",
+        "chorus": {
+            "description": "Chorus effect - thickens sound",
+            "params": {
+                "gain_in": "Input gain (default: 0.7)",
+                "gain_out": "Output gain (default: 0.9)",
+                "delay_ms": "Modulation delay in ms (default: 55)",
+                "decay": "Decay (default: 0.4)",
+                "speed": "Modulation speed in Hz (default: 0.25)",
+                "shape": "Modulation shape: s=sine, t=triangle (default: s)",
+            },
         },
-    },
-    "flanger": {
-        "description": "Flanger effect",
-        "params": {},
-    },
-    "phaser": {
-        "description": "Phaser effect",
-        "params": {},
-    },
-    "tremolo": {
-        "description": "Tremolo - amplitude modulation",
-        "params": {
-            "speed": "Speed in Hz (default: 6)",
-            "depth": "Depth 0-100 (default: 40)",
+        "flanger": {
+            "description": "Flanger effect",
+            "params": {},
         },
-    },
-    "overdrive": {
-        "description": "Overdrive / distortion",
-        "params": {
-            "gain": "Drive amount in dB (default: 20)",
+        "phaser": {
+            "description": "Phaser effect",
+            "params": {},
         },
-    },
-    "compressor": {
-        "description": "Dynamic range compression",
-        "params": {
-            "attack_decay": "Attack,decay in seconds (default: 0.3,1)",
-            "transfer": "Transfer function (default: 6:-70,-60,-20)",
+        "tremolo": {
+            "description": "Tremolo - amplitude modulation",
+            "params": {
+                "speed": "Speed in Hz (default: 6)",
+                "depth": "Depth 0-100 (default: 40)",
+            },
         },
-    },
-    "eq": {
-        "description": "Parametric equalizer",
-        "params": {
-            "frequency": "Center frequency in Hz (default: 1000)",
-            "width": "Bandwidth (default: 1q)",
-            "gain": "Gain in dB (default: 0)",
+        "overdrive": {
+            "description": "Overdrive / distortion",
+            "params": {
+                "gain": "Drive amount in dB (default: 20)",
+            },
         },
-    },
-    "bass": {
-        "description": "Bass boost/cut shelving EQ",
-        "params": {
-            "gain": "Gain in dB, positive=boost negative=cut (default: 0)",
+        "compressor": {
+            "description": "Dynamic range compression",
+            "params": {
+                "attack_decay": "Attack,decay in seconds (default: 0.3,1)",
+                "transfer": "Transfer function (default: 6:-70,-60,-20)",
+            },
         },
-    },
-    "treble": {
-        "description": "Treble boost/cut shelving EQ",
-        "params": {
-            "gain": "Gain in dB, positive=boost negative=cut (default: 0)",
+        "eq": {
+            "description": "Parametric equalizer",
+            "params": {
+                "frequency": "Center frequency in Hz (default: 1000)",
+                "width": "Bandwidth (default: 1q)",
+                "gain": "Gain in dB (default: 0)",
+            },
         },
-    },
-    "lowpass": {
-        "description": "Low-pass filter - cuts high frequencies",
-        "params": {
-            "frequency": "Cutoff frequency in Hz (default: 3000)",
+        "bass": {
+            "description": "Bass boost/cut shelving EQ",
+            "params": {
+                "gain": "Gain in dB, positive=boost negative=cut (default: 0)",
+            },
         },
-    },
-    "highpass": {
-        "description": "High-pass filter - cuts low frequencies",
-        "params": {
-            "frequency": "Cutoff frequency in Hz (default: 300)",
+        "treble": {
+            "description": "Treble boost/cut shelving EQ",
+            "params": {
+                "gain": "Gain in dB, positive=boost negative=cut (default: 0)",
+            },
         },
-    },
-    "pitch": {
-        "description": "Pitch shift",
-        "params": {
-            "cents": "Pitch shift in cents, 100=one semitone (default: 0)",
+        "lowpass": {
+            "description": "Low-pass filter - cuts high frequencies",
+            "params": {
+                "frequency": "Cutoff frequency in Hz (default: 3000)",
+            },
         },
-    },
-    "tempo": {
-        "description": "Time stretch without pitch change",
-        "params": {
-            "factor": "Speed factor, 2.0=double speed (default: 1.0)",
+        "highpass": {
+            "description": "High-pass filter - cuts low frequencies",
+            "params": {
+                "frequency": "Cutoff frequency in Hz (default: 300)",
+            },
         },
-    },
-    "norm": {
-        "description": "Normalize audio level",
-        "params": {
-            "level": "Target level in dB (default: -3)",
+        "pitch": {
+            "description": "Pitch shift",
+            "params": {
+                "cents": "Pitch shift in cents, 100=one semitone (default: 0)",
+            },
         },
-    },
-    "fade": {
-        "description": "Fade in and/or out",
-        "params": {
-            "type": "Curve type: t=linear, q=quarter-sine, h=half-sine, l=log, p=exp (default: t)",
-            "fade_in": "Fade in duration in seconds (default: 0)",
-            "stop": "Stop time in seconds, 0=end of file (default: 0)",
-            "fade_out": "Fade out duration in seconds (default: 0)",
+        "tempo": {
+            "description": "Time stretch without pitch change",
+            "params": {
+                "factor": "Speed factor, 2.0=double speed (default: 1.0)",
+            },
         },
-    },
-}
+        "norm": {
+            "description": "Normalize audio level",
+            "params": {
+                "level": "Target level in dB (default: -3)",
+            },
+        },
+        "fade": {
+            "description": "Fade in and/or out",
+            "params": {
+                "type": "Curve type: t=linear, q=quarter-sine, h=half-sine, l=log, p=exp (default: t)",
+                "fade_in": "Fade in duration in seconds (default: 0)",
+                "stop": "Stop time in seconds, 0=end of file (default: 0)",
+                "fade_out": "Fade out duration in seconds (default: 0)",
+            },
+        },
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _fx_descriptions() -> dict[str, str]:
+    return {name: info["description"] for name, info in _catalog().items()}
+
+
+# Numeric param values: a plain integer, or a decimal/exponent float
+_NUMBER_RE = re.compile(r"[-+]?(?:(?P<int>\d+)|(?P<float>(?:\d+\.\d*|\.\d+)(?:[eE][-+]?\d+)?|\d+[eE][-+]?\d+))")
 
 
 def parse_params(param_args: list[str]) -> dict:
@@ -196,27 +212,23 @@ def parse_params(param_args: list[str]) -> dict:
             print(f"Error: Parameter must be key=value format, got: {arg}", file=sys.stderr)
             sys.exit(1)
         key, value = arg.split("=", 1)
-        # Try to convert to number
-        try:
-            value = int(value)
-        except ValueError:
-            try:
-                value = float(value)
-            except ValueError:
-                pass
+        # Convert numbers, leave everything else as a string
+        m = _NUMBER_RE.fullmatch(value)
+        if m is not None:
+            value = int(value) if m["int"] is not None else float(value)
         params[key] = value
     return params
 
 
 def cmd_add(args):
     state.require_project()
-    if args.effect not in EFFECTS_CATALOG:
+    if args.effect not in _catalog():
         print(f"Warning: '{args.effect}' is not in the catalog. Adding as raw SoX effect.", file=sys.stderr)
 
     params = parse_params(args.params)
+    track = state.require_track(args.track_id)
     effect = state.add_effect(args.track_id, args.effect, params)
     chain = state.get_track_effects(args.track_id)
-    track = state.require_track(args.track_id)
     params_str = " ".join(f"{k}={v}" for k, v in effect["params"].items())
     print(f"Added {args.effect} to track {args.track_id} '{track['name']}' [{len(chain) - 1}] {params_str}")
 
@@ -236,9 +248,10 @@ def cmd_list(args):
         print(f"Track {args.track_id} '{track['name']}': no effects")
         return
     print(f"Track {args.track_id} '{track['name']}' effects chain:")
+    descriptions = _fx_descriptions()
     for i, fx in enumerate(effects):
         params_str = " ".join(f"{k}={v}" for k, v in fx["params"].items())
-        desc = EFFECTS_CATALOG.get(fx["name"], {}).get("description", "")
+        desc = descriptions.get(fx["name"], "")
         print(f"  [{i}] {fx['name']:<12} {params_str:<30} {desc}")
 
 
@@ -256,15 +269,13 @@ def cmd_preview(args):
         print(f"Error: Track {args.track_id} has no audio source", file=sys.stderr)
         sys.exit(1)
 
-    # Build sox effects inline (same logic as play.py)
-    from cornwall.sox_effects import build_sox_effects
-
     cmd = ["play", track["source"]]
     if track["volume"] != 1.0:
         cmd += ["vol", str(track["volume"])]
     cmd += build_sox_effects(args.track_id)
 
-    print(f"Preview: track {args.track_id} '{track['name']}' with {len(state.get_track_effects(args.track_id))} effects")
+    effects = state.get_track_effects(args.track_id)
+    print(f"Preview: track {args.track_id} '{track['name']}' with {len(effects)} effects")
     try:
         subprocess.run(cmd, check=True)
     except FileNotFoundError:
@@ -274,47 +285,57 @@ def cmd_preview(args):
 
 def cmd_catalog(args):
     print("Available effects:\n")
-    for name, info in EFFECTS_CATALOG.items():
+    for name, info in _catalog().items():
         print(f"  {name:<12} {info['description']}")
         for pname, pdesc in info["params"].items():
             print(f"    {pname:<16} {pdesc}")
         print()
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Manage effects chains on Cornwall tracks")
-    sub = parser.add_subparsers(dest="command")
-
-    p = sub.add_parser("add", help="Add an effect to a track")
+def _track_id_arg(p):
     p.add_argument("track_id", type=int, help="Track ID")
+
+
+def _add_args(p):
+    _track_id_arg(p)
     p.add_argument("effect", help="Effect name (see 'fx.py catalog')")
     p.add_argument("params", nargs="*", help="Parameters as key=value pairs")
 
-    p = sub.add_parser("remove", help="Remove an effect by index")
-    p.add_argument("track_id", type=int, help="Track ID")
+
+def _remove_args(p):
+    _track_id_arg(p)
     p.add_argument("index", type=int, help="Effect index in chain")
 
-    p = sub.add_parser("list", help="List effects on a track")
-    p.add_argument("track_id", type=int, help="Track ID")
 
-    p = sub.add_parser("clear", help="Clear all effects from a track")
-    p.add_argument("track_id", type=int, help="Track ID")
+# name -> (handler, help, adds the subcommand's arguments)
+COMMANDS = {
+    "add": (cmd_add, "Add an effect to a track", _add_args),
+    "remove": (cmd_remove, "Remove an effect by index", _remove_args),
+    "list": (cmd_list, "List effects on a track", _track_id_arg),
+    "clear": (cmd_clear, "Clear all effects from a track", _track_id_arg),
+    "preview": (cmd_preview, "Play a track with effects applied", _track_id_arg),
+    "catalog": (cmd_catalog, "Show available effects and parameters", None),
+}
 
-    p = sub.add_parser("preview", help="Play a track with effects applied")
-    p.add_argument("track_id", type=int, help="Track ID")
 
-    sub.add_parser("catalog", help="Show available effects and parameters")
+def main():
+    parser = argparse.ArgumentParser(description="Manage effects chains on Cornwall tracks")
+    sub = parser.add_subparsers(dest="command")
+
+    # Every command is listed for --help, but only the one being run gets its arguments
+    invoked = sys.argv[1] if len(sys.argv) > 1 else None
+    for name, (func, help_text, add_args) in COMMANDS.items():
+        p = sub.add_parser(name, help=help_text)
+        p.set_defaults(func=func)
+        if name == invoked and add_args is not None:
+            add_args(p)
 
     args = parser.parse_args()
-    if not args.command:
+    if not getattr(args, "func", None):
         parser.print_help()
         sys.exit(0)
 
-    cmds = {
-        "add": cmd_add, "remove": cmd_remove, "list": cmd_list,
-        "clear": cmd_clear, "preview": cmd_preview, "catalog": cmd_catalog,
-    }
-    cmds[args.command](args)
+    args.func(args)
 
 
 if __name__ == "__main__":
@@ -22,13 +22,13 @@ Examples:
 
 import argparse
 import os
+import shlex
 import signal
 import subprocess
 import sys
-import tempfile
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from cornwall import state
 from cornwall.sox_effects import build_sox_effects
 
@@ -74,37 +74,46 @@ def cmd_track(args):
     _run_sox(cmd)
 
 
-def _render_track_to_file(track: dict, output: str):
+def _render_track_to_file(track: dict, output: str, snap: state.Snapshot):
     """Render a single track with volume and effects to a file."""
     cmd = ["sox", track["source"], output, "vol", str(track["volume"])]
-    cmd += build_sox_effects(track["id"])
+    cmd += build_sox_effects(track["id"], snap)
     subprocess.run(cmd, check=True)
 
 
+def _mix_tracks_to_file(tracks: list[dict], output: str, snap: state.Snapshot):
+    """Mix tracks with volume and effects into output in a single sox run.
+
+    Each track is a "|sox ... -p" pipe input, so sox runs the per-track
+    chains concurrently and streams them into the mix without temp files.
+    """
+    inputs = []
+    for t in tracks:
+        cmd = ["sox", t["source"], "-p", "vol", str(t["volume"])]
+        cmd += build_sox_effects(t["id"], snap)
+        inputs.append("|" + shlex.join(cmd))
+    subprocess.run(["sox", "-m"] + inputs + [output], check=True)
+
+
 def cmd_mix(args):
     state.require_project()
-    active = state.get_active_tracks()
+    snap = state.load_snapshot()
+    active = snap.active_tracks
     if not active:
         print("Error: No active tracks with audio sources to mix", file=sys.stderr)
         sys.exit(1)
 
-    project_dir = state.get_project_dir()
+    project_dir = state.get_project_dir(snap.project)
     project_dir.mkdir(parents=True, exist_ok=True)
     output = args.output or str(project_dir / "mix.wav")
 
     if len(active) == 1:
         t = active[0]
         print(f"Rendering track '{t['name']}' -> {output}")
-        _render_track_to_file(t, output)
+        _render_track_to_file(t, output, snap)
     else:
         print(f"Mixing {len(active)} tracks -> {output}")
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_files = []
-            for t in active:
-                tmp = os.path.join(tmpdir, f"track_{t['id']}.wav")
-                _render_track_to_file(t, tmp)
-                tmp_files.append(tmp)
-            subprocess.run(["sox", "-m"] + tmp_files + [output], check=True)
+        _mix_tracks_to_file(active, output, snap)
 
     print(f"Rendered: {output}")
     if not args.no_play:
@@ -130,11 +139,12 @@ def cmd_loop(args):
         state.clear_playback_pid()
 
     if args.target == "mix":
-        project_dir = state.get_project_dir()
+        snap = state.load_snapshot()
+        project_dir = state.get_project_dir(snap.project)
         output = str(project_dir / "mix.wav")
 
         # Render first
-        active = state.get_active_tracks()
+        active = snap.active_tracks
         if not active:
             print("Error: No active tracks with audio sources", file=sys.stderr)
             sys.exit(1)
@@ -142,16 +152,10 @@ def cmd_loop(args):
         if len(active) == 1:
             t = active[0]
             print(f"Rendering track '{t['name']}'...")
-            _render_track_to_file(t, output)
+            _render_track_to_file(t, output, snap)
         else:
             print(f"Mixing {len(active)} tracks...")
-            with tempfile.TemporaryDirectory() as tmpdir:
-                tmp_files = []
-                for t in active:
-                    tmp = os.path.join(tmpdir, f"track_{t['id']}.wav")
-                    _render_track_to_file(t, tmp)
-                    tmp_files.append(tmp)
-                subprocess.run(["sox", "-m"] + tmp_files + [output], check=True)
+            _mix_tracks_to_file(active, output, snap)
 
         file_to_loop = output
     else:
@@ -206,36 +210,37 @@ def main():
     sub = parser.add_subparsers(dest="command")
 
     p = sub.add_parser("track", help="Play a single track")
+    p.set_defaults(func=cmd_track)
     p.add_argument("id", type=int, help="Track ID")
     p.add_argument("--start", type=float, help="Start position in seconds")
     p.add_argument("--duration", type=float, help="Duration in seconds")
 
     p = sub.add_parser("mix", help="Render and play the full mix")
+    p.set_defaults(func=cmd_mix)
     p.add_argument("--output", help="Output file path")
     p.add_argument("--no-play", action="store_true", help="Render only, don't play")
 
     p = sub.add_parser("render", help="Render mix to file (no playback)")
+    p.set_defaults(func=cmd_render)
     p.add_argument("--output", help="Output file path")
 
     p = sub.add_parser("loop", help="Loop a track or mix in background")
+    p.set_defaults(func=cmd_loop)
     p.add_argument("target", help="Track ID or 'mix'")
 
-    sub.add_parser("stop", help="Stop background playback")
-    sub.add_parser("status", help="Check playback status")
+    sub.add_parser("stop", help="Stop background playback").set_defaults(func=cmd_stop)
+    sub.add_parser("status", help="Check playback status").set_defaults(func=cmd_status)
 
     p = sub.add_parser("file", help="Play any audio file")
+    p.set_defaults(func=cmd_file)
     p.add_argument("path", help="Path to audio file")
 
     args = parser.parse_args()
-    if not args.command:
+    if not getattr(args, "func", None):
         parser.print_help()
         sys.exit(0)
 
-    cmds = {
-        "track": cmd_track, "mix": cmd_mix, "render": cmd_render,
-        "loop": cmd_loop, "stop": cmd_stop, "status": cmd_status, "file": cmd_file,
-    }
-    cmds[args.command](args)
+    args.func(args)
 
 
 if __name__ == "__main__":
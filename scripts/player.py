@@ -1,4 +1,4 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -SE
 """Query the Cornwall player's state from Claude Code.
 
 Usage: player.py <command>
@@ -27,17 +27,32 @@ Examples:
 
 import argparse
 import json
+import os
 import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-from cornwall import state
+try:
+    import orjson
+except ImportError:  # optional, stdlib json is the fallback
+    orjson = None
+
+# Polled in tight loops, so this doesn't import cornwall.state just for the
+# path: it mirrors state.STATE_DIR (<repo>/state)
+STATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "state")
+STATUS_FILE = os.path.join(STATE_DIR, ".player.json")
+
+
+def _load_state() -> dict | None:
+    """Read the player's status file, or None if the player isn't running."""
+    try:
+        with open(STATUS_FILE, "rb") as f:
+            return orjson.loads(f.read()) if orjson is not None else json.load(f)
+    except FileNotFoundError:
+        return None
 
 
 def cmd_status(args):
-    status_file = state.STATE_DIR / ".player.json"
-    if status_file.exists():
-        data = json.loads(status_file.read_text())
+    data = _load_state()
+    if data is not None:
         if args.json:
             print(json.dumps(data, indent=2))
         else:
@@ -56,26 +71,23 @@ def cmd_status(args):
 
 
 def cmd_playing(args):
-    status_file = state.STATE_DIR / ".player.json"
-    if status_file.exists():
-        data = json.loads(status_file.read_text())
+    data = _load_state()
+    if data is not None:
         sys.exit(0 if data.get("playing") else 1)
     sys.exit(1)
 
 
 def cmd_position(args):
-    status_file = state.STATE_DIR / ".player.json"
-    if status_file.exists():
-        data = json.loads(status_file.read_text())
+    data = _load_state()
+    if data is not None:
         print(f"{data.get('position_secs', 0):.2f}")
     else:
         print("0.00")
 
 
 def cmd_bar(args):
-    status_file = state.STATE_DIR / ".player.json"
-    if status_file.exists():
-        data = json.loads(status_file.read_text())
+    data = _load_state()
+    if data is not None:
         print(f"{data.get('bar', 0)}.{data.get('beat', 0)}")
     else:
         print("0.0")
@@ -86,20 +98,19 @@ def main():
     sub = parser.add_subparsers(dest="command")
 
     p = sub.add_parser("status", help="Show current player state")
+    p.set_defaults(func=cmd_status)
     p.add_argument("--json", action="store_true", help="Output as raw JSON")
 
-    sub.add_parser("playing", help="Exit 0 if playing, 1 if stopped")
-    sub.add_parser("position", help="Print current position in seconds")
-    sub.add_parser("bar", help="Print current bar number")
+    sub.add_parser("playing", help="Exit 0 if playing, 1 if stopped").set_defaults(func=cmd_playing)
+    sub.add_parser("position", help="Print current position in seconds").set_defaults(func=cmd_position)
+    sub.add_parser("bar", help="Print current bar number").set_defaults(func=cmd_bar)
 
     args = parser.parse_args()
-    if not args.command:
+    if not getattr(args, "func", None):
         parser.print_help()
         sys.exit(0)
 
-    {"status": cmd_status, "playing": cmd_playing, "position": cmd_position, "bar": cmd_bar}[
-        args.command
-    ](args)
+    args.func(args)
 
 
 if __name__ == "__main__":
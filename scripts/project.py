@@ -34,10 +34,10 @@ Examples:
 
 import argparse
 import json
+import os
 import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from cornwall import state
 
 
@@ -58,13 +58,12 @@ def cmd_info(args):
     if args.json:
         print(json.dumps(project, indent=2))
         return
-    tracks = state.get_tracks()
     print(f"Project: {project['name']}")
     print(f"BPM:     {project['bpm']}")
     print(f"Rate:    {project['sample_rate']}Hz")
     print(f"Time:    {project['time_sig']}")
     print(f"Created: {project['created']}")
-    print(f"Tracks:  {len(tracks)}")
+    print(f"Tracks:  {state.count_tracks()}")
 
 
 def cmd_set(args):
@@ -89,7 +88,11 @@ def cmd_open(args):
     project_dir = state.PROJECTS_DIR / args.name
     if not project_dir.exists():
         print(f"Project '{args.name}' not found in {state.PROJECTS_DIR}/", file=sys.stderr)
-        available = [d.name for d in state.PROJECTS_DIR.iterdir() if d.is_dir()]
+        try:
+            with os.scandir(state.PROJECTS_DIR) as it:
+                available = [e.name for e in it if e.is_dir()]
+        except FileNotFoundError:
+            available = []
         if available:
             print("Available projects: " + ", ".join(available), file=sys.stderr)
         else:
@@ -107,27 +110,31 @@ def main():
     sub = parser.add_subparsers(dest="command")
 
     p_create = sub.add_parser("create", help="Create a new project")
+    p_create.set_defaults(func=cmd_create)
     p_create.add_argument("--name", required=True, help="Project name")
     p_create.add_argument("--bpm", type=int, default=120, help="Tempo in BPM (default: 120)")
     p_create.add_argument("--sample-rate", type=int, default=44100, help="Sample rate in Hz (default: 44100)")
     p_create.add_argument("--time-sig", default="4/4", help="Time signature (default: 4/4)")
 
     p_info = sub.add_parser("info", help="Show current project info")
+    p_info.set_defaults(func=cmd_info)
     p_info.add_argument("--json", action="store_true", help="Output as raw JSON")
 
     p_set = sub.add_parser("set", help="Change a project setting")
+    p_set.set_defaults(func=cmd_set)
     p_set.add_argument("key", help="Setting key: name, bpm, sample-rate, time-sig")
     p_set.add_argument("value", help="New value")
 
     p_open = sub.add_parser("open", help="Open an existing project")
+    p_open.set_defaults(func=cmd_open)
     p_open.add_argument("name", help="Project name")
 
     args = parser.parse_args()
-    if not args.command:
+    if not getattr(args, "func", None):
         parser.print_help()
         sys.exit(0)
 
-    {"create": cmd_create, "info": cmd_info, "set": cmd_set, "open": cmd_open}[args.command](args)
+    args.func(args)
 
 
 if __name__ == "__main__":
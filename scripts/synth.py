@@ -64,58 +64,142 @@ Examples:
 """
 
 import argparse
+import array
+import ast
+import functools
+import hashlib
+import json
 import math
 import os
-import struct
+import shutil
 import subprocess
 import sys
 import tempfile
 import wave
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-from cornwall import state
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@functools.lru_cache(maxsize=1)
+def _numpy():
+    """Import numpy on first use: it takes ~100ms and only tone/bytebeat need it."""
+    try:
+        import numpy
+    except ImportError:  # optional, bytebeat falls back to a per-sample loop
+        return None
+    return numpy
+
 
 # Note name to frequency mapping (A4 = 440Hz)
 NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
 NOTE_ALIASES = {"Db": "C#", "Eb": "D#", "Gb": "F#", "Ab": "G#", "Bb": "A#"}
 
+# Semitones above A for every accepted note name, aliases included
+_SEMITONE = {name: i - NOTE_NAMES.index("A") for i, name in enumerate(NOTE_NAMES)}
+_SEMITONE.update({alias: _SEMITONE[name] for alias, name in NOTE_ALIASES.items()})
+
 SAMPLE_RATE = 44100
 
 
+@functools.lru_cache(maxsize=256)
 def note_to_freq(note: str) -> float:
     """Convert note name (e.g., 'A4', 'C#3', 'Bb5') to frequency."""
-    name = note[:-1]
     octave = int(note[-1])
-    name = NOTE_ALIASES.get(name, name)
-    if name not in NOTE_NAMES:
-        raise ValueError(f"Unknown note: {note}")
-    semitone = NOTE_NAMES.index(name) - NOTE_NAMES.index("A")
+    try:
+        semitone = _SEMITONE[note[:-1]]
+    except KeyError:
+        raise ValueError(f"Unknown note: {note}") from None
     semitone += (octave - 4) * 12
     return 440.0 * (2.0 ** (semitone / 12.0))
 
 
 def _default_output() -> str:
+    from cornwall import state
+
     state._ensure_dirs()
     fd, path = tempfile.mkstemp(suffix=".wav", dir=str(state.STATE_DIR), prefix="synth_")
     os.close(fd)
     return path
 
 
+def _connect_daemon(sock_path: str):
+    import socket
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(sock_path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _play_via_daemon(path: str) -> bool:
+    """Play through cornwall.audio_daemon, starting it if it isn't running.
+
+    Returns False when the daemon can't be used (sounddevice/soundfile not
+    installed, startup failed, or it couldn't play the file), so the caller
+    falls back to spawning a player.
+    """
+    import importlib.util
+    import time
+
+    from cornwall import state
+
+    sock_path = str(state.STATE_DIR / "audio.sock")
+    sock = _connect_daemon(sock_path)
+    if sock is None:
+        if not all(importlib.util.find_spec(m) for m in ("sounddevice", "soundfile")):
+            return False
+        daemon = subprocess.Popen(
+            [sys.executable, "-m", "cornwall.audio_daemon"], cwd=state.ROOT, start_new_session=True,
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        # Stop waiting as soon as the daemon dies (e.g. PortAudio missing)
+        deadline = time.monotonic() + 5
+        while sock is None and daemon.poll() is None and time.monotonic() < deadline:
+            time.sleep(0.05)
+            sock = _connect_daemon(sock_path)
+        if sock is None:
+            return False
+
+    request = {"cmd": "play", "path": os.path.abspath(path)}
+    with sock:
+        try:
+            sock.sendall((json.dumps(request) + "\n").encode())
+            with sock.makefile("rb") as f:
+                reply = json.loads(f.readline() or b"{}")
+        except (OSError, ValueError):
+            return False
+    return bool(reply.get("ok"))
+
+
 def _play_file(path: str):
+    if _play_via_daemon(path):
+        return
     try:
         subprocess.run(["play", path], check=True)
     except FileNotFoundError:
         subprocess.run(["afplay", path], check=True)
 
 
-def _sox_synth(output: str, duration: float, volume: float, synth_args: list[str]):
-    """Use SoX to generate synthesis."""
+def _sox_synth(output: str, duration: float, volume: float, synth_args: list[str],
+               channels: int = 1, effects: list[str] | None = None):
+    """Use SoX to generate synthesis.
+
+    channels sets the width of the null input; synth fills one channel per
+    waveform spec, so layered sounds pass one spec per channel and mix down.
+    effects are appended after vol in the same sox run.
+    """
     Path(output).parent.mkdir(parents=True, exist_ok=True)
-    cmd = [
-        "sox", "-n", "-r", str(SAMPLE_RATE), "-b", "16", output,
+    cmd = ["sox"]
+    if channels > 1:
+        cmd += ["-c", str(channels)]
+    cmd += [
+        "-n", "-r", str(SAMPLE_RATE), "-b", "16", output,
         "synth", str(duration),
-    ] + synth_args + ["vol", str(volume)]
+    ] + synth_args + ["vol", str(volume)] + (effects or [])
     try:
         subprocess.run(cmd, check=True)
     except FileNotFoundError:
@@ -123,17 +207,65 @@ def _sox_synth(output: str, duration: float, volume: float, synth_args: list[str
         sys.exit(1)
 
 
-def _write_wav(path: str, samples: list[int], sample_rate: int = SAMPLE_RATE, sample_width: int = 2):
-    """Write raw samples to a WAV file."""
+WAV_BLOCK = 1 << 16  # Samples converted and written per chunk
+
+
+def _wav_frames(block, sample_width: int) -> bytes:
+    """Clip one block of samples (list of ints or numpy array) to frame bytes."""
+    np = _numpy()
+    if np is not None:
+        if sample_width == 1:
+            return np.clip(block, 0, 255).astype(np.uint8).tobytes()
+        return np.clip(block, -32768, 32767).astype("<i2").tobytes()
+    if sample_width == 1:
+        return array.array("B", [max(0, min(255, s)) for s in block]).tobytes()
+    frames = array.array("h", [max(-32768, min(32767, s)) for s in block])
+    if sys.byteorder == "big":
+        frames.byteswap()  # WAV samples are little-endian
+    return frames.tobytes()
+
+
+def _write_wav_blocks(path: str, blocks, sample_rate: int = SAMPLE_RATE, sample_width: int = 2) -> int:
+    """Stream blocks of samples to a WAV file and return the frame count.
+
+    Only one block is held in memory at a time; the header is patched once
+    on close rather than after every block.
+    """
+    frames = 0
     with wave.open(path, "w") as wf:
         wf.setnchannels(1)
         wf.setsampwidth(sample_width)
         wf.setframerate(sample_rate)
-        if sample_width == 1:
-            data = struct.pack(f"{len(samples)}B", *[max(0, min(255, s)) for s in samples])
-        else:
-            data = struct.pack(f"{len(samples)}h", *[max(-32768, min(32767, s)) for s in samples])
-        wf.writeframes(data)
+        for block in blocks:
+            wf.writeframesraw(_wav_frames(block, sample_width))
+            frames += len(block)
+    return frames
+
+
+def _tone_blocks(np, wave: str, freq: float, num_samples: int, volume: float):
+    for start in range(0, num_samples, WAV_BLOCK):
+        phase = (np.arange(start, min(start + WAV_BLOCK, num_samples)) * (freq / SAMPLE_RATE)) % 1.0
+        if wave == "sine":
+            y = np.sin(2 * np.pi * phase)
+        elif wave == "square":
+            y = np.where(phase < 0.5, 1.0, -1.0)
+        elif wave == "sawtooth":
+            y = 2 * phase - 1
+        else:  # triangle
+            y = np.where(phase < 0.5, 4 * phase - 1, 3 - 4 * phase)
+        yield np.rint(y * (volume * 32767))
+
+
+def _synth_tone(wave: str, freq: float, duration: float, volume: float):
+    """Blocks of 16-bit samples for a basic waveform, or None without numpy.
+
+    Shapes follow sox's synth at zero phase: square is high for the first
+    half-period, sawtooth and triangle start at -1.
+    """
+    np = _numpy()
+    if np is None or wave not in ("sine", "square", "sawtooth", "triangle"):
+        return None
+    return _tone_blocks(np, wave, freq, round(duration * SAMPLE_RATE), volume)
 
 
 def cmd_tone(args):
@@ -146,7 +278,13 @@ def cmd_tone(args):
             print(f"Error: {e}", file=sys.stderr)
             sys.exit(1)
 
-    _sox_synth(output, args.duration, args.volume, [args.wave, str(freq)])
+    # Plain waveforms are cheap enough to compute in-process rather than spawning sox
+    blocks = _synth_tone(args.wave, freq, args.duration, args.volume)
+    if blocks is not None:
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        _write_wav_blocks(output, blocks)
+    else:
+        _sox_synth(output, args.duration, args.volume, [args.wave, str(freq)])
     print(f"Generated {args.wave} tone at {freq:.1f}Hz, {args.duration}s -> {output}")
     if args.play:
         _play_file(output)
@@ -193,26 +331,15 @@ def cmd_chord(args):
         print("Error: No frequencies specified", file=sys.stderr)
         sys.exit(1)
 
-    # SoX can layer multiple synths with the : separator
+    # One sox run: each note on its own channel, then averaged down to mono
+    # (the same 1/n mix sox -m applies)
     synth_args = []
-    for i, freq in enumerate(freqs):
-        if i > 0:
-            synth_args.append(":")
-            synth_args.append("synth")
-            synth_args.append(str(args.duration))
-        synth_args.append(args.wave)
-        synth_args.append(str(freq))
-
-    # Mix by creating individual files and combining
-    with tempfile.TemporaryDirectory() as tmpdir:
-        parts = []
-        per_volume = args.volume / math.sqrt(len(freqs))  # Equal-power mixing
-        for i, freq in enumerate(freqs):
-            part = os.path.join(tmpdir, f"tone_{i}.wav")
-            _sox_synth(part, args.duration, per_volume, [args.wave, str(freq)])
-            parts.append(part)
-
-        subprocess.run(["sox", "-m"] + parts + [output], check=True)
+    for freq in freqs:
+        synth_args += [args.wave, str(freq)]
+    if len(freqs) > 1:
+        synth_args += ["channels", "1"]
+    per_volume = args.volume / math.sqrt(len(freqs))  # Equal-power mixing
+    _sox_synth(output, args.duration, per_volume, synth_args, channels=len(freqs))
 
     note_str = args.notes or ",".join(f"{f:.1f}Hz" for f in freqs)
     print(f"Generated {args.wave} chord [{note_str}], {args.duration}s -> {output}")
@@ -220,82 +347,321 @@ def cmd_chord(args):
         _play_file(output)
 
 
+# Drum hits as single sox runs: keyword arguments for _sox_synth
+DRUMS = {
+    # Sine wave pitch sweep from 150Hz to 40Hz with fast decay
+    "kick": dict(duration=0.5, volume=0.9, synth_args=["sine", "150-40"],
+                 effects=["fade", "t", "0", "0.5", "0.4"]),
+    # 200Hz tone and white noise on two channels, mixed 0.7:0.5 then halved (as sox -m did)
+    "snare": dict(duration=0.2, volume=0.5, channels=2,
+                  synth_args=["sine", "200", "whitenoise", "remix", "-m", "1v0.7,2v0.5"],
+                  effects=["fade", "t", "0", "0.2", "0.15", "highpass", "200"]),
+    "hat": dict(duration=0.1, volume=0.5, synth_args=["whitenoise"],
+                effects=["fade", "t", "0", "0.1", "0.08", "highpass", "7000"]),
+    "clap": dict(duration=0.15, volume=0.6, synth_args=["whitenoise"],
+                 effects=["fade", "t", "0", "0.15", "0.12", "bandpass", "1500", "2000"]),
+    "tom": dict(duration=0.4, volume=0.8, synth_args=["sine", "120-60"],
+                effects=["fade", "t", "0", "0.4", "0.3"]),
+}
+
+
+def _drum_cache_path(drum_type: str) -> Path | None:
+    """Cache file for a drum hit, keyed by its recipe and the sox binary.
+
+    Replacing or upgrading sox changes its mtime and so the key; without sox
+    on PATH there is nothing to key on and the hit is not cached.
+    """
+    from cornwall import state
+
+    sox = shutil.which("sox")
+    if sox is None:
+        return None
+    st = os.stat(sox)
+    key = repr((DRUMS[drum_type], SAMPLE_RATE, sox, st.st_mtime_ns, st.st_size))
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return state.STATE_DIR / ".drum_cache" / f"{drum_type}-{digest}.wav"
+
+
 def cmd_drum(args):
     output = args.output or _default_output()
     drum_type = args.type
 
-    if drum_type == "kick":
-        # Sine wave pitch sweep from 150Hz to 40Hz with fast decay
-        _sox_synth(output, 0.5, 0.9, [
-            "sine", "150-40",
-        ])
-        # Add a click at the start
-        with tempfile.TemporaryDirectory() as tmpdir:
-            click = os.path.join(tmpdir, "click.wav")
-            _sox_synth(click, 0.01, 0.9, ["noise", "whitenoise"])
-            body = os.path.join(tmpdir, "body.wav")
-            os.rename(output, body)
-            subprocess.run([
-                "sox", body, output,
-                "fade", "t", "0", "0.5", "0.4",
-            ], check=True)
-
-    elif drum_type == "snare":
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tone_part = os.path.join(tmpdir, "tone.wav")
-            _sox_synth(tone_part, 0.2, 0.7, ["sine", "200"])
-            noise_part = os.path.join(tmpdir, "noise.wav")
-            _sox_synth(noise_part, 0.2, 0.5, ["whitenoise"])
-            # Mix and apply fade
-            mixed = os.path.join(tmpdir, "mixed.wav")
-            subprocess.run(["sox", "-m", tone_part, noise_part, mixed], check=True)
-            subprocess.run([
-                "sox", mixed, output,
-                "fade", "t", "0", "0.2", "0.15",
-                "highpass", "200",
-            ], check=True)
-
-    elif drum_type == "hat":
-        _sox_synth(output, 0.1, 0.5, ["whitenoise"])
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp = os.path.join(tmpdir, "hat.wav")
-            os.rename(output, tmp)
-            subprocess.run([
-                "sox", tmp, output,
-                "fade", "t", "0", "0.1", "0.08",
-                "highpass", "7000",
-            ], check=True)
-
-    elif drum_type == "clap":
-        _sox_synth(output, 0.15, 0.6, ["whitenoise"])
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp = os.path.join(tmpdir, "clap.wav")
-            os.rename(output, tmp)
-            subprocess.run([
-                "sox", tmp, output,
-                "fade", "t", "0", "0.15", "0.12",
-                "bandpass", "1500", "2000",
-            ], check=True)
-
-    elif drum_type == "tom":
-        _sox_synth(output, 0.4, 0.8, ["sine", "120-60"])
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp = os.path.join(tmpdir, "tom.wav")
-            os.rename(output, tmp)
-            subprocess.run([
-                "sox", tmp, output,
-                "fade", "t", "0", "0.4", "0.3",
-            ], check=True)
-
-    else:
+    recipe = DRUMS.get(drum_type)
+    if recipe is None:
         print(f"Error: Unknown drum type: {drum_type}. Use: kick, snare, hat, clap, tom", file=sys.stderr)
         sys.exit(1)
 
+    cache = _drum_cache_path(drum_type)
+    if cache is not None and cache.exists():
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(cache, output)
+    else:
+        _sox_synth(output, **recipe)
+        if cache is not None:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache.with_name(f"{cache.name}.tmp.{os.getpid()}")
+            shutil.copyfile(output, tmp)
+            os.replace(tmp, cache)
+
     print(f"Generated {drum_type} -> {output}")
     if args.play:
         _play_file(output)
 
 
+@functools.lru_cache(maxsize=64)
+def _int64_safe(expr: str, allow_compare: bool) -> bool:
+    """Whether evaluating expr on int64 (numpy, numba) can match Python ints.
+
+    numpy turns comparisons into bool arrays (+ becomes OR, ~ becomes NOT),
+    numba's ~ on a bool is a logical NOT too, and both return garbage for
+    shift counts outside 0..63 where Python raises. Expressions using those
+    go to the scalar loop. Overflow is caught at run time by the guarded
+    operators (see _guard_overflow).
+    """
+    try:
+        tree = ast.parse(expr, mode="eval")
+    except SyntaxError:
+        return False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and node.id not in ("t", "abs", "int"):
+            return False  # Only the names the scalar path provides
+        if isinstance(node, ast.Compare) and not allow_compare:
+            return False
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Invert):
+            return False
+        if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.LShift, ast.RShift)):
+            count = node.right
+            if not (isinstance(count, ast.Constant) and type(count.value) is int and 0 <= count.value < 64):
+                return False
+    return True
+
+
+# int64 arithmetic wraps where Python ints grow, and a wrapped intermediate
+# can surface anywhere later (through //, %, >>). Every operator that can grow
+# a value is routed through a helper that estimates the result's magnitude in
+# float64 and raises OverflowError near the int64 limit, sending the block to
+# the scalar loop. float64 is accurate to far better than the 2x margin.
+_INT64_LIMIT = 2.0 ** 62
+_GUARDED_OPS = {ast.Add: "_add", ast.Sub: "_sub", ast.Mult: "_mul", ast.Pow: "_pow", ast.LShift: "_lshift"}
+
+
+class _GuardOverflow(ast.NodeTransformer):
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        name = _GUARDED_OPS.get(type(node.op))
+        if name is None:
+            return node
+        return ast.copy_location(ast.Call(ast.Name(name, ast.Load()), [node.left, node.right], []), node)
+
+
+@functools.lru_cache(maxsize=64)
+def _guard_overflow(expr: str) -> str:
+    """Rewrite expr so + - * ** << call the overflow-checked helpers."""
+    tree = _GuardOverflow().visit(ast.parse(expr, mode="eval"))
+    return ast.unparse(ast.fix_missing_locations(tree))
+
+
+@functools.lru_cache(maxsize=1)
+def _np_ops() -> dict:
+    """Overflow-checked numpy helpers for _guard_overflow'd expressions."""
+    np = _numpy()
+
+    def mag(x):
+        return np.abs(np.asarray(x, dtype=np.float64))
+
+    def checked(result, magnitude):
+        if np.any(magnitude >= _INT64_LIMIT):
+            raise OverflowError("bytebeat value leaves int64")
+        return result
+
+    def to_int(x):
+        x = np.asarray(x)
+        return checked(x, mag(x)).astype(np.int64)  # Truncates toward zero, like int()
+
+    return {
+        "_add": lambda a, b: checked(a + b, mag(a) + mag(b)),
+        "_sub": lambda a, b: checked(a - b, mag(a) + mag(b)),
+        "_mul": lambda a, b: checked(a * b, mag(a) * mag(b)),
+        "_pow": lambda a, b: checked(a ** b, mag(a) ** np.asarray(b, dtype=np.float64)),
+        "_lshift": lambda a, b: checked(a << b, mag(a) * np.exp2(b)),
+        "abs": np.abs,
+        "int": to_int,
+    }
+
+
+def _bytebeat_numpy(expr: str, start: int, stop: int):
+    """Evaluate a bytebeat expression over sample indices start..stop at once.
+
+    Returns an int64 array of 8-bit values, or None if numpy isn't installed
+    or the expression doesn't vectorize (conditionals, per-sample errors,
+    int64 overflow, operators whose int64 behaviour differs from Python's).
+    """
+    np = _numpy()
+    if np is None or not _int64_safe(expr, allow_compare=False):
+        return None
+    try:
+        code = compile(_guard_overflow(expr), "<bytebeat>", "eval")
+        ops = _np_ops()
+        t = np.arange(start, stop, dtype=np.int64)
+        # Raise on divide-by-zero etc. so those samples get the scalar path's handling
+        with np.errstate(all="raise"):
+            val = eval(code, {"__builtins__": {}}, dict(ops, t=t))
+            return np.broadcast_to(ops["int"](val), t.shape) & 0xFF
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _numba():
+    """Import numba on first use: it takes ~200ms and only the bytebeat fallback needs it."""
+    try:
+        import numba
+    except ImportError:  # optional, JIT for bytebeat expressions numpy can't vectorize
+        return None
+    return numba
+
+
+# Scalar counterparts of _np_ops for the numba kernel, njit-compiled by
+# _numba_ops. "* 1.0" because numba has no float(bool); "not <" also
+# rejects nan (e.g. a negative base ** a fraction).
+def _checked_add(a, b):
+    if not abs(a * 1.0) + abs(b * 1.0) < _INT64_LIMIT:
+        raise OverflowError("bytebeat value leaves int64")
+    return a + b
+
+
+def _checked_sub(a, b):
+    if not abs(a * 1.0) + abs(b * 1.0) < _INT64_LIMIT:
+        raise OverflowError("bytebeat value leaves int64")
+    return a - b
+
+
+def _checked_mul(a, b):
+    if not abs(a * 1.0) * abs(b * 1.0) < _INT64_LIMIT:
+        raise OverflowError("bytebeat value leaves int64")
+    return a * b
+
+
+def _checked_pow(a, b):
+    if not abs(a * 1.0) ** (b * 1.0) < _INT64_LIMIT:
+        raise OverflowError("bytebeat value leaves int64")
+    return a ** b
+
+
+def _checked_lshift(a, b):
+    if not abs(a * 1.0) * 2.0 ** b < _INT64_LIMIT:
+        raise OverflowError("bytebeat value leaves int64")
+    return a << b
+
+
+def _checked_int(x):
+    if not abs(x * 1.0) < _INT64_LIMIT:
+        raise OverflowError("bytebeat value leaves int64")
+    return int(x)
+
+
+@functools.lru_cache(maxsize=1)
+def _numba_ops() -> dict:
+    njit = _numba().njit
+    return {
+        "_add": njit(_checked_add), "_sub": njit(_checked_sub), "_mul": njit(_checked_mul),
+        "_pow": njit(_checked_pow), "_lshift": njit(_checked_lshift), "int": njit(_checked_int),
+    }
+
+
+# Compiled numba bytebeat loops keyed by expression; None marks one that failed to compile
+_bytebeat_kernels: dict = {}
+
+
+def _bytebeat_source(expr: str):
+    """Splice expr into a per-sample loop and return the plain Python function.
+
+    expr must already have passed _int64_safe (a lone expression naming only
+    t, abs and int); its growing operators and int() are overflow-checked.
+    """
+    src = (
+        "def _bytebeat(start, stop):\n"
+        "    out = _np.empty(stop - start, _np.int64)\n"
+        "    for t in _range(start, stop):\n"
+        f"        out[t - start] = int(({_guard_overflow(expr)})) & 0xFF\n"
+        "    return out\n"
+    )
+    namespace = {"__builtins__": {}, "_np": _numpy(), "_range": range, "abs": abs, **_numba_ops()}
+    exec(src, namespace)
+    return namespace["_bytebeat"]
+
+
+def _bytebeat_numba(expr: str, start: int, stop: int):
+    """Run a bytebeat expression through a numba-compiled per-sample loop.
+
+    Handles what numpy can't broadcast (conditionals, short-circuit logic).
+    Returns None if numba isn't installed, the expression isn't int64-safe or
+    won't compile in nopython mode, or any sample raises (int64 overflow included).
+    """
+    if _numpy() is None or not _int64_safe(expr, allow_compare=True):
+        return None
+    numba = _numba()
+    if numba is None:
+        return None
+    if expr in _bytebeat_kernels:
+        kernel = _bytebeat_kernels[expr]
+    else:
+        try:
+            kernel = numba.njit(_bytebeat_source(expr))
+        except Exception:
+            kernel = None
+        _bytebeat_kernels[expr] = kernel
+    if kernel is None:
+        return None
+    try:
+        return kernel(start, stop)
+    except numba.core.errors.NumbaError:
+        # njit compiles on first call; remember the failure so later blocks don't retry it
+        _bytebeat_kernels[expr] = None
+        return None
+    except Exception:
+        return None  # Runtime error (e.g. divide by zero) somewhere in this block
+
+
+def _bytebeat_scalar(expr: str, start: int, stop: int) -> list[int]:
+    try:
+        code = compile(expr, "<bytebeat>", "eval")
+    except SyntaxError:
+        return [128] * (stop - start)
+    # Provide t and common operations
+    g = {"__builtins__": {}}
+    ns = {"t": 0, "abs": abs, "int": int}
+    samples = [0] * (stop - start)
+    t = start
+    while t < stop:
+        # The handler sits outside the inner loop: a failing sample gets 128
+        # and the loop resumes at the next one.
+        try:
+            for t in range(t, stop):
+                ns["t"] = t
+                samples[t - start] = int(eval(code, g, ns)) & 0xFF
+        except Exception:
+            samples[t - start] = 128
+        t += 1
+    return samples
+
+
+def _bytebeat_blocks(expr: str, num_samples: int):
+    """Yield the bytebeat signal in WAV_BLOCK-sized chunks.
+
+    Each block takes the fastest path that handles it, so a divide-by-zero
+    at t=0 only sends the first block down the slow path.
+    """
+    for start in range(0, num_samples, WAV_BLOCK):
+        stop = min(start + WAV_BLOCK, num_samples)
+        block = _bytebeat_numpy(expr, start, stop)
+        if block is None:
+            block = _bytebeat_numba(expr, start, stop)
+        if block is None:
+            block = _bytebeat_scalar(expr, start, stop)
+        yield block
+
+
 def cmd_bytebeat(args):
     output = args.output or _default_output()
     expr = args.expression
@@ -304,17 +670,8 @@ def cmd_bytebeat(args):
 
     # Bytebeat: evaluate expression for each sample where t is the sample index
     # Output is 8-bit unsigned
-    samples = []
-    for t in range(num_samples):
-        try:
-            # Provide t and common operations
-            val = eval(expr, {"__builtins__": {}}, {"t": t, "abs": abs, "int": int})
-            samples.append(int(val) & 0xFF)
-        except Exception:
-            samples.append(128)
-
-    _write_wav(output, samples, sample_rate=sr, sample_width=1)
-    print(f"Generated bytebeat ({len(samples)} samples at {sr}Hz) -> {output}")
+    frames = _write_wav_blocks(output, _bytebeat_blocks(expr, num_samples), sample_rate=sr, sample_width=1)
+    print(f"Generated bytebeat ({frames} samples at {sr}Hz) -> {output}")
     if args.play:
         _play_file(output)
 
@@ -344,6 +701,7 @@ def main():
     sub = parser.add_subparsers(dest="command")
 
     p = sub.add_parser("tone", help="Generate a simple waveform")
+    p.set_defaults(func=cmd_tone)
     p.add_argument("--wave", default="sine", choices=["sine", "square", "sawtooth", "triangle"],
                    help="Waveform type (default: sine)")
     p.add_argument("--freq", type=float, default=440, help="Frequency in Hz (default: 440)")
@@ -354,6 +712,7 @@ def main():
     p.add_argument("--play", action="store_true", help="Play after generating")
 
     p = sub.add_parser("noise", help="Generate noise")
+    p.set_defaults(func=cmd_noise)
     p.add_argument("--type", default="white", help="Noise type: white, pink, brown, tpdf (default: white)")
     p.add_argument("--duration", type=float, default=2, help="Duration in seconds (default: 2)")
     p.add_argument("--volume", type=float, default=0.5, help="Volume 0-1 (default: 0.5)")
@@ -361,6 +720,7 @@ def main():
     p.add_argument("--play", action="store_true", help="Play after generating")
 
     p = sub.add_parser("chord", help="Generate a chord")
+    p.set_defaults(func=cmd_chord)
     p.add_argument("--notes", help="Comma-separated note names, e.g. C4,E4,G4")
     p.add_argument("--freqs", help="Comma-separated frequencies")
     p.add_argument("--wave", default="sine", help="Waveform type (default: sine)")
@@ -370,11 +730,13 @@ def main():
     p.add_argument("--play", action="store_true", help="Play after generating")
 
     p = sub.add_parser("drum", help="Generate a drum hit")
+    p.set_defaults(func=cmd_drum)
     p.add_argument("type", choices=["kick", "snare", "hat", "clap", "tom"], help="Drum type")
     p.add_argument("--output", help="Output WAV file")
     p.add_argument("--play", action="store_true", help="Play after generating")
 
     p = sub.add_parser("bytebeat", help="Generate audio from a bytebeat expression")
+    p.set_defaults(func=cmd_bytebeat)
     p.add_argument("expression", help="Bytebeat expression using 't' as sample index")
     p.add_argument("--sample-rate", type=int, default=8000, help="Sample rate (default: 8000)")
     p.add_argument("--duration", type=float, default=10, help="Duration in seconds (default: 10)")
@@ -382,20 +744,17 @@ def main():
     p.add_argument("--play", action="store_true", help="Play after generating")
 
     p = sub.add_parser("csound", help="Render a Csound .csd file")
+    p.set_defaults(func=cmd_csound)
     p.add_argument("file", help="Path to .csd file")
     p.add_argument("--output", help="Output WAV file")
     p.add_argument("--play", action="store_true", help="Play after rendering")
 
     args = parser.parse_args()
-    if not args.command:
+    if not getattr(args, "func", None):
         parser.print_help()
         sys.exit(0)
 
-    cmds = {
-        "tone": cmd_tone, "noise": cmd_noise, "chord": cmd_chord,
-        "drum": cmd_drum, "bytebeat": cmd_bytebeat, "csound": cmd_csound,
-    }
-    cmds[args.command](args)
+    args.func(args)
 
 
 if __name__ == "__main__":
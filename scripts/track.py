@@ -28,11 +28,12 @@ Examples:
 
 import argparse
 import json
+import os
 import shutil
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from cornwall import state
 
 
@@ -131,6 +132,41 @@ def cmd_info(args):
         print("Effects: (none)")
 
 
+_FICLONE = 0x40049409  # linux/fs.h: _IOW(0x94, 9, int)
+
+
+def _fast_copy(src: Path, dest: Path):
+    """Copy src to dest, cloning copy-on-write where the filesystem allows.
+
+    Uses the FICLONE ioctl on Linux (Btrfs, XFS) and clonefile(2) on macOS
+    (APFS); anything else falls back to a regular shutil.copy2.
+    """
+    if dest.exists() and os.path.samefile(src, dest):
+        return  # Already in place (symlinked audio/ dir or a hardlink)
+    # Clone beside dest and swap it in, so dest is never truncated before
+    # the clone succeeds
+    tmp = dest.with_name(f".{dest.name}.{os.getpid()}")
+    if sys.platform.startswith("linux"):
+        import fcntl
+
+        try:
+            with open(src, "rb") as fsrc, open(tmp, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, tmp)
+            os.replace(tmp, dest)
+            return
+        except OSError:
+            tmp.unlink(missing_ok=True)
+    elif sys.platform == "darwin":
+        import ctypes
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(os.fsencode(src), os.fsencode(tmp), 0) == 0:
+            os.replace(tmp, dest)
+            return
+    shutil.copy2(src, dest)
+
+
 def cmd_import(args):
     state.require_project()
     state.require_track(args.id)
@@ -145,7 +181,7 @@ def cmd_import(args):
 
     dest = audio_dir / src.name
     if src != dest:
-        shutil.copy2(src, dest)
+        _fast_copy(src, dest)
     track = state.update_track(args.id, source=str(dest))
     print(f"Imported '{src.name}' to track {args.id} '{track['name']}'")
 
@@ -155,59 +191,65 @@ def main():
     sub = parser.add_subparsers(dest="command")
 
     p = sub.add_parser("add", help="Add a new track")
+    p.set_defaults(func=cmd_add)
     p.add_argument("--name", required=True, help="Track name")
     p.add_argument("--type", default="audio", help="Track type: audio, midi, synth (default: audio)")
 
     p = sub.add_parser("list", help="List all tracks")
+    p.set_defaults(func=cmd_list)
     p.add_argument("--json", action="store_true", help="Output as raw JSON")
 
     p = sub.add_parser("remove", help="Remove a track")
+    p.set_defaults(func=cmd_remove)
     p.add_argument("id", type=int, help="Track ID")
 
     p = sub.add_parser("solo", help="Solo a track")
+    p.set_defaults(func=cmd_solo)
     p.add_argument("id", type=int, help="Track ID")
 
     p = sub.add_parser("unsolo", help="Unsolo a track")
+    p.set_defaults(func=cmd_unsolo)
     p.add_argument("id", type=int, help="Track ID")
 
     p = sub.add_parser("mute", help="Mute a track")
+    p.set_defaults(func=cmd_mute)
     p.add_argument("id", type=int, help="Track ID")
 
     p = sub.add_parser("unmute", help="Unmute a track")
+    p.set_defaults(func=cmd_unmute)
     p.add_argument("id", type=int, help="Track ID")
 
     p = sub.add_parser("volume", help="Set track volume")
+    p.set_defaults(func=cmd_volume)
     p.add_argument("id", type=int, help="Track ID")
     p.add_argument("level", type=float, help="Volume level 0.0-2.0 (1.0 = unity)")
 
     p = sub.add_parser("pan", help="Set track pan")
+    p.set_defaults(func=cmd_pan)
     p.add_argument("id", type=int, help="Track ID")
     p.add_argument("position", type=float, help="Pan position -1.0 (left) to 1.0 (right)")
 
     p = sub.add_parser("rename", help="Rename a track")
+    p.set_defaults(func=cmd_rename)
     p.add_argument("id", type=int, help="Track ID")
     p.add_argument("new_name", help="New track name")
 
     p = sub.add_parser("info", help="Show detailed track info")
+    p.set_defaults(func=cmd_info)
     p.add_argument("id", type=int, help="Track ID")
     p.add_argument("--json", action="store_true", help="Output as raw JSON")
 
     p = sub.add_parser("import", help="Import an audio file to a track")
+    p.set_defaults(func=cmd_import)
     p.add_argument("id", type=int, help="Track ID")
     p.add_argument("file", help="Path to audio file")
 
     args = parser.parse_args()
-    if not args.command:
+    if not getattr(args, "func", None):
         parser.print_help()
         sys.exit(0)
 
-    cmds = {
-        "add": cmd_add, "list": cmd_list, "remove": cmd_remove,
-        "solo": cmd_solo, "unsolo": cmd_unsolo, "mute": cmd_mute, "unmute": cmd_unmute,
-        "volume": cmd_volume, "pan": cmd_pan, "rename": cmd_rename,
-        "info": cmd_info, "import": cmd_import,
-    }
-    cmds[args.command](args)
+    args.func(args)
 
 
 if __name__ == "__main__":